@@ -1,19 +1,19 @@
+import numpy as np
 import pandas as pd
 
 # Load your CSV file
 df = pd.read_csv("Fixes\Decoded\D12.csv")
 
-# Replace only the score column with categories
-def categorize_bns(score):
-    if score < -0.566:
-        return "Offensive"
-    elif score <= 0.566:
-        return "Normal"
-    else:
-        return "Profanity"
+# Replace only the score column with categories:
+#   score < -0.566          -> Offensive
+#   -0.566 <= score <= 0.566 -> Normal
+#   score > 0.566           -> Profanity
+BNS_EDGES = np.array([-0.566, np.nextafter(0.566, np.inf)])
+BNS_LABELS = np.array(["Offensive", "Normal", "Profanity"])
 
-# Apply conversion
-df['BNS_score'] = df['BNS_score'].apply(categorize_bns)
+# Apply conversion (side='right': a score equal to an edge goes to the upper bin)
+scores = df['BNS_score'].to_numpy(dtype=np.float64)
+df['BNS_score'] = BNS_LABELS[np.searchsorted(BNS_EDGES, scores, side='right')]
 
 # Save the new CSV
 df.to_csv("Fixes\Reformatted\D12.csv", index=False)
@@ -1,18 +1,16 @@
+import numpy as np
 import pandas as pd
 
 # Load dataset
 df = pd.read_csv("Fixes\Decoded\D13.csv")
 
-def categorize_chi2(score):
-    if score <= 0:
-        return "Normal"
-    elif score <= 200:
-        return "Offensive"
-    else:
-        return "Profanity"
+# score <= 0 -> Normal, score <= 200 -> Offensive, otherwise Profanity
+CHI2_EDGES = np.array([0, 200])
+CHI2_LABELS = np.array(["Normal", "Offensive", "Profanity"])
 
-# Apply mapping
-df['Chi2_score'] = df['Chi2_score'].apply(categorize_chi2)
+# Apply mapping (side='left': a score equal to an edge stays in the lower bin)
+scores = df['Chi2_score'].to_numpy(dtype=np.float64)
+df['Chi2_score'] = CHI2_LABELS[np.searchsorted(CHI2_EDGES, scores, side='left')]
 
 # Save
 df.to_csv("Fixes\Reformatted\D13.csv", index=False)
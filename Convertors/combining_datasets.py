@@ -15,28 +15,50 @@ Run:
 """
 
 import os
+import codecs
 import glob
+import itertools
 import json
 import unicodedata
 import re
 from collections import defaultdict
+import charset_normalizer
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 
 # -------------------------
 # USER CONFIG - edit these
 # -------------------------
 INPUT_DIR = "All_datasets/"               
 OUTPUT_PATH = "Merged_dataset.csv"      
+USE_FAST_CSV = False         # try the multithreaded pyarrow CSV reader before the pandas cascade
+USE_PARQUET = False          # True: write OUTPUT_PATH as snappy Parquet (same name, .parquet) instead of CSV
+STREAM_CHUNKSIZE = 0         # >0: stream inputs in chunks of this many rows straight into the output file
 PER_SOURCE_DIST_OUT = "merged_3class_per_source_distribution.csv"
 SUMMARY_JSON_OUT = "merged_3class_summary.json"
 
 DROP_UNMAPPED = False        
 DEFAULT_MAP_TARGET = "normal"  
 DROP_EXACT_DUPLICATES = False
+REPORT_DUPLICATES = True     # log the exact text duplicate count (costs a full hash pass)
 KEEP_ALL_COLUMNS = True     
 ORIGINAL_TEXT_COL = "original_text" 
 
 CANONICAL_LABELS = {"normal", "offensive", "profanity"}
+CSV_ENCODINGS = ['utf_8', 'cp1256', 'latin_1']   # candidates for detect_csv_encoding
+# Cells pd.read_csv treats as missing by default; arrow_read_csv nulls the same ones
+PANDAS_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Lower-cased fallback table, tried when a raw label has no LABEL_MAP entry
+FALLBACK_LABELS = {
+    **dict.fromkeys(['0', 'none', 'neutral', 'normal', 'clean', 'non'], 'normal'),
+    **dict.fromkeys(['1', 'offensive', 'offence', 'abusive', 'hate', 'abuse', 'toxic', 'insult'], 'offensive'),
+    **dict.fromkeys(['2', 'profanity', 'swear', 'swear_word', 'vulgar', 'obscene'], 'profanity'),
+}
 
 # -------------------------
 # Label mapping function
@@ -47,6 +69,8 @@ def get_label_map():
 
     source_name should match the filename (without extension) that the script uses as the 'source'.
     To apply a global mapping for any source, use the key 'all' or '' (empty string).
+    Original labels are matched after stripping whitespace, case-insensitively.
+    Entries under 'all' therefore override the built-in fallback (FALLBACK_LABELS) for every casing.
 
     Example:
         return {
@@ -106,22 +130,95 @@ def get_label_map():
 def find_files(input_dir, patterns=None):
     if patterns is None:
         patterns = ['**/*.csv', '**/*.tsv', '**/*.json', '**/*.xlsx', '**/*.xls', '**/*.parquet']
-    files = []
-    for p in patterns:
-        files.extend(glob.glob(os.path.join(input_dir, p), recursive=True))
-    files = sorted(files)
+    files = sorted(itertools.chain.from_iterable(
+        glob.iglob(os.path.join(input_dir, p), recursive=True) for p in patterns
+    ))
+    # a .parquet next to a .csv/.tsv of the same name is picked up by safe_read_table instead
+    tabular_stems = {os.path.splitext(f)[0] for f in files if f.lower().endswith(('.csv', '.tsv'))}
+    files = [f for f in files
+             if not (f.lower().endswith('.parquet') and os.path.splitext(f)[0] in tabular_stems)]
     return files
 
+def parquet_sibling(path):
+    """
+    Return the .parquet file next to `path` if it exists and is at least as new, else None.
+    """
+    candidate = os.path.splitext(path)[0] + '.parquet'
+    if os.path.exists(candidate) and os.path.getmtime(candidate) >= os.path.getmtime(path):
+        return candidate
+    return None
+
+def arrow_read_csv(path, sep):
+    """
+    Read a UTF-8 CSV with pyarrow's multithreaded reader, keeping every column as text.
+    Column names and missing values come out as pd.read_csv(dtype=str) would give them;
+    raises ValueError when the header does not line up with pandas' reading of it.
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True)
+    # tweets often carry line breaks inside quoted fields
+    parse_options = pa_csv.ParseOptions(delimiter=sep, newlines_in_values=True)
+    with pa_csv.open_csv(path, read_options=read_options, parse_options=parse_options) as reader:
+        names = reader.schema.names
+    # pandas renames blank headers to "Unnamed: i" and repeats to "name.1", "name.2", ...
+    pandas_names = list(pd.read_csv(path, sep=sep, encoding='utf-8', nrows=0).columns)
+    if len(pandas_names) != len(names):
+        raise ValueError(f"{path}: pyarrow sees {len(names)} columns, pandas {len(pandas_names)}")
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in names},
+        null_values=PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    table = pa_csv.read_csv(path, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    return table.rename_columns(pandas_names).to_pandas()
+
+def detect_csv_encoding(path, sample_size=65536):
+    """
+    Pick the most plausible of CSV_ENCODINGS for the first `sample_size` bytes of a file,
+    using charset_normalizer.
+    Pure-ASCII heads are read as UTF-8, since Arabic text may only start further down.
+    """
+    with open(path, 'rb') as fh:
+        sample = fh.read(sample_size)
+    # cut at the last newline so a multi-byte character is never split at the sample edge
+    if len(sample) == sample_size and b'\n' in sample:
+        sample = sample[:sample.rindex(b'\n') + 1]
+    best = charset_normalizer.from_bytes(sample, cp_isolation=CSV_ENCODINGS).best()
+    if best is None or best.encoding == 'ascii':
+        return 'utf-8'
+    return best.encoding
+
+def file_decodes(path, encoding, block_size=1 << 20):
+    """
+    Return True if the whole file decodes with `encoding`, reading it in fixed-size blocks.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(path, 'rb') as fh:
+            for block in iter(lambda: fh.read(block_size), b''):
+                decoder.decode(block)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
 def safe_read_table(path):
     ext = os.path.splitext(path)[1].lower()
     if ext in {'.csv', '.tsv'}:
+        sibling = parquet_sibling(path)
+        if sibling is not None:
+            return pd.read_parquet(sibling)
         sep = '\t' if ext == '.tsv' else ','
-        for enc in ('utf-8', 'utf-8-sig', 'latin1', 'cp1256'):
+        if USE_FAST_CSV:
             try:
-                return pd.read_csv(path, sep=sep, encoding=enc, dtype=str)
+                return arrow_read_csv(path, sep)
             except Exception:
-                continue
-        raise
+                pass
+        enc = detect_csv_encoding(path)
+        try:
+            return pd.read_csv(path, sep=sep, encoding=enc, dtype=str, engine='c')
+        except UnicodeDecodeError:
+            return pd.read_csv(path, sep=sep, encoding='latin1', dtype=str, engine='c')
     elif ext in {'.json'}:
         try:
             return pd.read_json(path, dtype=str, lines=True)
@@ -134,6 +231,69 @@ def safe_read_table(path):
     else:
         raise ValueError(f"Unsupported file type: {path}")
 
+def stream_csv_encoding(path):
+    """
+    Encoding for a chunked CSV read: the detect_csv_encoding() guess when the whole
+    file decodes with it, else latin1. Checked up front since a chunked read cannot retry.
+    """
+    enc = detect_csv_encoding(path)
+    # the head probe can miss bytes further down
+    if not file_decodes(path, enc):
+        print(f"[INFO] {path} does not fully decode as {enc}; reading as latin1.")
+        enc = 'latin1'
+    return enc
+
+def table_header(path):
+    """
+    Return an empty DataFrame with the columns and dtypes iter_table_chunks(path) yields.
+    CSV/TSV and Parquet only read the header or schema; other formats are read whole.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in {'.csv', '.tsv'}:
+        sibling = parquet_sibling(path)
+        if sibling is None:
+            sep = '\t' if ext == '.tsv' else ','
+            return pd.read_csv(path, sep=sep, encoding=stream_csv_encoding(path), dtype=str, nrows=0)
+        path, ext = sibling, '.parquet'
+    if ext == '.parquet':
+        return pq.read_schema(path).empty_table().to_pandas()
+    return safe_read_table(path).iloc[:0]
+
+def iter_table_chunks(path, chunksize):
+    """
+    Yield the table at `path` as DataFrames of at most `chunksize` rows.
+    CSV/TSV and Parquet are read incrementally; other formats are read whole and sliced.
+    The row index keeps counting across chunks, as it would for a single read.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in {'.csv', '.tsv'}:
+        sibling = parquet_sibling(path)
+        if sibling is None:
+            sep = '\t' if ext == '.tsv' else ','
+            enc = stream_csv_encoding(path)
+            yield from pd.read_csv(path, sep=sep, encoding=enc, dtype=str, chunksize=chunksize)
+            return
+        path, ext = sibling, '.parquet'
+    if ext == '.parquet':
+        offset = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+        return
+    df = safe_read_table(path)
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize].copy()
+
+def write_parquet(df, path):
+    """
+    Write df as snappy-compressed Parquet, storing object columns as Arrow strings.
+    """
+    obj_cols = [c for c in df.columns if df[c].dtype == 'object']
+    df = df.astype({c: 'string[pyarrow]' for c in obj_cols})
+    df.to_parquet(path, compression='snappy', index=False)
+
 def canonicalize_columns(df, prefer_text_fields=None, prefer_label_fields=None):
     if prefer_text_fields is None:
         prefer_text_fields = ['text', 'content', 'tweet', 'sentence', 'comment', 'post']
@@ -162,54 +322,227 @@ def canonicalize_columns(df, prefer_text_fields=None, prefer_label_fields=None):
 
     return text_col, label_col, id_col
 
+_ARABIC_CHAR_MAP = str.maketrans({
+    '\u0640': '',                  # tatweel
+    'إ': 'ا', 'أ': 'ا', 'آ': 'ا',   # alef variants -> ا
+    'ى': 'ي',                       # alef maqsura to ya
+})
+_DIACRITICS_RE = re.compile(r'[\u064B-\u065F\u0670]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def arabic_normalize(text: str) -> str:
     if not isinstance(text, str):
         text = str(text) if text is not None else ""
-    text = unicodedata.normalize('NFKC', text)
-    text = text.replace('\u0640', '')             # tatweel
-    text = re.sub(r'[إأآ]', 'ا', text)             # alef variants -> ا
-    text = re.sub(r'[\u064B-\u065F\u0670]', '', text)  # remove diacritics
-    text = re.sub(r'ى', 'ي', text)                # alef maqsura to ya
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def map_label_for_row(src, lbl_raw, label_map):
-    lbl_raw = "" if lbl_raw is None else str(lbl_raw).strip()
-    mapped = None
-    if src in label_map and lbl_raw in label_map[src]:
-        mapped = label_map[src][lbl_raw]
-    elif 'all' in label_map and lbl_raw in label_map['all']:
-        mapped = label_map['all'][lbl_raw]
-    elif '' in label_map and lbl_raw in label_map['']:
-        mapped = label_map[''][lbl_raw]
-
-    if mapped is None and lbl_raw != "":
-        low = lbl_raw.lower()
-        if low in {'0','none','neutral','normal','clean','non'}:
-            mapped = 'normal'
-        elif low in {'1','offensive','offence','abusive','hate','abuse','toxic','insult'}:
-            mapped = 'offensive'
-        elif low in {'2','profanity','swear','swear_word','vulgar','obscene'}:
-            mapped = 'profanity'
-    if mapped is None:
-        if DROP_UNMAPPED:
-            return None
-        else:
-            mapped = DEFAULT_MAP_TARGET
-    mapped = mapped.lower().strip()
-    if mapped not in CANONICAL_LABELS:
-        return DEFAULT_MAP_TARGET
+    text = unicodedata.normalize('NFKC', text).translate(_ARABIC_CHAR_MAP)
+    text = _DIACRITICS_RE.sub('', text)         # remove diacritics
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+# RE2 (used by pyarrow) only treats ASCII as \s; the extra classes cover the rest of Python's \s
+_WHITESPACE_RE2 = r'[\s\v\x1c-\x1f\x85\p{Z}]+'
+
+def arabic_normalize_series(texts):
+    """
+    Column-wise arabic_normalize, run as pyarrow compute kernels over the whole Series.
+    """
+    arr = pa.array(texts, type=pa.string(), from_pandas=True)
+    arr = pc.utf8_normalize(arr, form='NFKC')
+    arr = pc.replace_substring(arr, '\u0640', '')                  # tatweel
+    arr = pc.replace_substring_regex(arr, '[إأآ]', 'ا')             # alef variants -> ا
+    arr = pc.replace_substring_regex(arr, '[\u064B-\u065F\u0670]', '')  # remove diacritics
+    arr = pc.replace_substring(arr, 'ى', 'ي')                       # alef maqsura to ya
+    arr = pc.utf8_trim_whitespace(pc.replace_substring_regex(arr, _WHITESPACE_RE2, ' '))
+    return pd.Series(arr.to_numpy(zero_copy_only=False), index=texts.index, name=texts.name)
+
+def build_label_lookup(src, label_map):
+    """
+    Flatten FALLBACK_LABELS and the '', 'all' and per-source mappings (later ones win)
+    into a single dict keyed by the stripped, lower-cased raw label.
+    Targets outside CANONICAL_LABELS resolve to DEFAULT_MAP_TARGET.
+    """
+    lookup = {}
+    for mapping in (FALLBACK_LABELS, label_map.get('', {}), label_map.get('all', {}), label_map.get(src, {})):
+        for raw, target in mapping.items():
+            target = target.lower().strip()
+            lookup[str(raw).strip().lower()] = target if target in CANONICAL_LABELS else DEFAULT_MAP_TARGET
+    return lookup
+
+def map_labels(labels, lookup):
+    """
+    Map a whole Series of raw labels through a build_label_lookup() dict.
+    Unmapped labels become DEFAULT_MAP_TARGET, or NaN when DROP_UNMAPPED is set.
+    """
+    mapped = labels.str.strip().str.lower().map(lookup)
+    if not DROP_UNMAPPED:
+        mapped = mapped.fillna(DEFAULT_MAP_TARGET)
     return mapped
 
 # -------------------------
 # Main merge routine
 # -------------------------
+def prepare_frame(df, fname, lookup):
+    """
+    Turn one source table (or one chunk of it) into merged-format rows,
+    mapping labels through `lookup` (see build_label_lookup).
+    Returns None when the table has no text-like column.
+    """
+    text_col, label_col, id_col = canonicalize_columns(df)
+    if text_col is None:
+        return None
+
+    df[text_col] = df[text_col].astype(str).fillna('')
+    if label_col is not None:
+        df[label_col] = df[label_col].astype(str).fillna('')
+    else:
+        df['__no_label__'] = ''
+        label_col = '__no_label__'
+
+    if id_col is not None:
+        df[id_col] = df[id_col].astype(str)
+    else:
+        df['_auto_idx_'] = df.index.astype(str)
+        id_col = '_auto_idx_'
+
+    labels = map_labels(df[label_col], lookup)
+    keep = labels.notna()
+    if not keep.all():
+        df = df[keep]
+        labels = labels[keep]
+
+    out = pd.DataFrame({
+        "global_id": (fname + "_") + df[id_col].astype('string[pyarrow]'),
+        "source": fname,
+        "text": arabic_normalize_series(df[text_col]),
+        "label_orig": df[label_col],
+        "label": labels
+    })
+
+    if KEEP_ALL_COLUMNS:
+        out = pd.concat([out, df.add_prefix("orig__")], axis=1)
+    return out
+
+def merged_output_path():
+    if USE_PARQUET:
+        return os.path.splitext(OUTPUT_PATH)[0] + '.parquet'
+    return OUTPUT_PATH
+
+def write_reports(per_src, per_file_counts):
+    """
+    Save the per-source label distribution and the summary JSON.
+    per_src is a source x label table of row counts.
+    """
+    label_counts = per_src.sum().sort_values(ascending=False)
+    per_src = per_src.copy()
+    per_src['total'] = per_src.sum(axis=1)
+    per_src = per_src.sort_values('total', ascending=False)
+    per_src.to_csv(PER_SOURCE_DIST_OUT, encoding='utf-8-sig')
+    print(f"Saved per-source distribution: {PER_SOURCE_DIST_OUT}")
+
+    summary = {
+        "rows": int(per_src['total'].sum()),
+        "label_counts": {label: int(n) for label, n in label_counts.items()},
+        "files_processed_counts": per_file_counts
+    }
+    with open(SUMMARY_JSON_OUT, 'w', encoding='utf-8') as fh:
+        json.dump(summary, fh, ensure_ascii=False, indent=2)
+    print(f"Saved summary JSON: {SUMMARY_JSON_OUT}")
+
+def merge_streaming(files, label_map):
+    """
+    Chunked variant of merge_all used when STREAM_CHUNKSIZE > 0.
+
+    A first pass reads only each file's header (see table_header) to fix the output
+    columns, in the order merge_all would produce them. Each chunk is then mapped,
+    reindexed to those columns and appended to the output file as soon as it is read,
+    so peak memory is bounded by the chunk size instead of the corpus size. The
+    exact-duplicate check is skipped. A file that fails part-way keeps the rows already
+    written and is listed in files_processed_counts as "<name> (partial)".
+    Returns only the 'source' and 'label' columns of the result.
+    """
+    sources = []
+    columns = {}
+    for fpath in files:
+        fname = os.path.splitext(os.path.basename(fpath))[0]
+        lookup = build_label_lookup(fname, label_map)
+        try:
+            header = table_header(fpath)
+        except Exception as e:
+            print(f"[WARN] Could not read {fpath}: {e}; skipping.")
+            continue
+        out = prepare_frame(header, fname, lookup)
+        if out is None:
+            print(f"[WARN] No text-like column in {fpath}; skipping.")
+            continue
+        columns.update(dict.fromkeys(out.columns))
+        sources.append((fpath, fname, lookup))
+    if not sources:
+        raise RuntimeError("No rows collected. Check INPUT_DIR and LABEL_MAP.")
+    columns = list(columns)
+    if ORIGINAL_TEXT_COL not in columns:
+        columns.append(ORIGINAL_TEXT_COL)
+
+    out_path = merged_output_path()
+    schema = None
+    writer = None
+    if USE_PARQUET:
+        schema = pa.schema([(c, pa.string()) for c in columns])
+        writer = pq.ParquetWriter(out_path, schema, compression='snappy')
+    rows_written = 0
+    per_file_counts = {}
+    pair_counts = None
+    try:
+        for fpath, fname, lookup in sources:
+            file_rows = 0
+            try:
+                for chunk in iter_table_chunks(fpath, STREAM_CHUNKSIZE):
+                    out = prepare_frame(chunk, fname, lookup)
+                    if ORIGINAL_TEXT_COL not in out.columns:
+                        out[ORIGINAL_TEXT_COL] = out['text']
+                    out = out.reindex(columns=columns)
+
+                    if writer is not None:
+                        table = pa.Table.from_pandas(out.astype('string[pyarrow]'), preserve_index=False)
+                        writer.write_table(table.cast(schema))
+                    elif rows_written == 0:
+                        out.to_csv(out_path, index=False, encoding='utf-8-sig', mode='w')
+                    else:
+                        out.to_csv(out_path, index=False, encoding='utf-8-sig', mode='a', header=False)
+
+                    counts = out.groupby(['source', 'label']).size()
+                    pair_counts = counts if pair_counts is None else pair_counts.add(counts, fill_value=0)
+                    rows_written += len(out)
+                    file_rows += len(out)
+            except Exception as e:
+                print(f"[WARN] Could not read {fpath}: {e}; skipping rest of file.")
+                if not file_rows:
+                    continue
+                print(f"[WARN] {fpath}: {file_rows} rows were already written; recorded as partial.")
+                fname = f"{fname} (partial)"
+            per_file_counts[fname] = file_rows
+            print(f"Processed {fpath} -> collected {file_rows} rows")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if rows_written == 0:
+        raise RuntimeError("No rows collected. Check INPUT_DIR and LABEL_MAP.")
+    print(f"Saved merged file: {out_path} (rows: {rows_written})")
+    print("[INFO] Exact duplicate check skipped in streaming mode.")
+
+    write_reports(pair_counts.astype(int).unstack(fill_value=0), per_file_counts)
+
+    if USE_PARQUET:
+        return pd.read_parquet(out_path, columns=['source', 'label'])
+    return pd.read_csv(out_path, usecols=['source', 'label'], dtype=str, encoding='utf-8-sig')
+
 def merge_all():
     label_map = get_label_map()
     files = find_files(INPUT_DIR)
     print(f"Found {len(files)} files to process under: {INPUT_DIR}")
 
-    all_rows = []
+    if STREAM_CHUNKSIZE and STREAM_CHUNKSIZE > 0:
+        return merge_streaming(files, label_map)
+
+    frames = []
     per_file_counts = {}
     for fpath in files:
         try:
@@ -218,63 +551,27 @@ def merge_all():
             print(f"[WARN] Could not read {fpath}: {e}; skipping.")
             continue
         fname = os.path.splitext(os.path.basename(fpath))[0]
-        text_col, label_col, id_col = canonicalize_columns(df)
-        if text_col is None:
+        out = prepare_frame(df, fname, build_label_lookup(fname, label_map))
+        if out is None:
             print(f"[WARN] No text-like column in {fpath}; skipping.")
             continue
 
-        df[text_col] = df[text_col].astype(str).fillna('')
-        if label_col is not None:
-            df[label_col] = df[label_col].astype(str).fillna('')
-        else:
-            df['__no_label__'] = ''
-            label_col = '__no_label__'
+        per_file_counts[fname] = len(out)
+        frames.append(out)
+        print(f"Processed {fpath} -> collected {len(out)} rows")
 
-        if id_col is not None:
-            df[id_col] = df[id_col].astype(str)
-        else:
-            df['_auto_idx_'] = df.index.astype(str)
-            id_col = '_auto_idx_'
-
-        rows_from_file = []
-        for idx, row in df.iterrows():
-            src = fname
-            raw_text = row[text_col]
-            raw_label = row[label_col] if label_col in row else ""
-            mapped = map_label_for_row(src, raw_label, label_map)
-            if mapped is None:
-                continue
-
-            normalized_text = arabic_normalize(raw_text)
-            data_row = {
-                "global_id": f"{src}_{row[id_col]}",
-                "source": src,
-                "text": normalized_text,
-                "label_orig": raw_label,
-                "label": mapped
-            }
-
-            if KEEP_ALL_COLUMNS:
-                for col in df.columns:
-                    val = row[col]
-                    data_row[f"orig__{col}"] = val
-
-            rows_from_file.append(data_row)
-
-        per_file_counts[fname] = len(rows_from_file)
-        all_rows.extend(rows_from_file)
-        print(f"Processed {fpath} -> collected {len(rows_from_file)} rows")
-
-    if len(all_rows) == 0:
+    if sum(per_file_counts.values()) == 0:
         raise RuntimeError("No rows collected. Check INPUT_DIR and LABEL_MAP.")
 
-    merged = pd.DataFrame(all_rows)
+    merged = pd.concat(frames, ignore_index=True)
 
-    duplicates_count = int(merged.duplicated(subset=['text']).sum())
-    if duplicates_count > 0:
-        print(f"[INFO] Exact text duplicates found: {duplicates_count}. All duplicates are being kept per config.")
-    else:
-        print("[INFO] No exact text duplicates found.")
+    if REPORT_DUPLICATES or DROP_EXACT_DUPLICATES:
+        texts = pa.array(merged['text'], type=pa.string())
+        duplicates_count = len(texts) - pc.count_distinct(texts, mode='all').as_py()
+        if duplicates_count > 0:
+            print(f"[INFO] Exact text duplicates found: {duplicates_count}. All duplicates are being kept per config.")
+        else:
+            print("[INFO] No exact text duplicates found.")
 
     bad = set(merged['label'].unique()) - CANONICAL_LABELS
     if bad:
@@ -284,23 +581,19 @@ def merge_all():
     if ORIGINAL_TEXT_COL not in merged.columns:
         merged[ORIGINAL_TEXT_COL] = merged['text']
 
-    merged.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
-    print(f"Saved merged file: {OUTPUT_PATH} (rows: {len(merged)})")
+    # few distinct values: store as categoricals (smaller, and crosstab works on the codes)
+    merged['source'] = merged['source'].astype('category')
+    merged['label'] = merged['label'].astype('category')
 
-    per_src = merged.groupby('source')['label'].value_counts().unstack(fill_value=0)
-    per_src['total'] = per_src.sum(axis=1)
-    per_src = per_src.sort_values('total', ascending=False)
-    per_src.to_csv(PER_SOURCE_DIST_OUT, encoding='utf-8-sig')
-    print(f"Saved per-source distribution: {PER_SOURCE_DIST_OUT}")
+    out_path = merged_output_path()
+    if USE_PARQUET:
+        write_parquet(merged, out_path)
+    else:
+        merged.to_csv(out_path, index=False, encoding='utf-8-sig')
+    print(f"Saved merged file: {out_path} (rows: {len(merged)})")
 
-    summary = {
-        "rows": int(len(merged)),
-        "label_counts": merged['label'].value_counts().to_dict(),
-        "files_processed_counts": per_file_counts
-    }
-    with open(SUMMARY_JSON_OUT, 'w', encoding='utf-8') as fh:
-        json.dump(summary, fh, ensure_ascii=False, indent=2)
-    print(f"Saved summary JSON: {SUMMARY_JSON_OUT}")
+    per_src = pd.crosstab(merged['source'], merged['label'])
+    write_reports(per_src, per_file_counts)
 
     return merged
 
@@ -1,27 +1,27 @@
+import re
+from pathlib import Path
+
 import pandas as pd
 
 
+# blank line(s) between sentences
+SENTENCE_BREAK_RE = re.compile(r'\n\s*\n')
+# Second tab-separated field of a non-comment line, as line.strip().split("\t")[1] would
+# give it: group 1 when more non-blank fields follow, group 2 (right-stripped) when it is last
+TOKEN_RE = re.compile(
+    r'^[^\S\n]*[^\s#][^\t\n]*\t(?:([^\t\n]*)\t(?=[^\n]*\S)|([^\t\n]*?\S)[^\S\n]*$)',
+    flags=re.MULTILINE,
+)
 
 
 def conllu_to_csv(conllu_file, output_csv):
+    data = Path(conllu_file).read_text(encoding="utf-8")
+
     sentences = []
-    current_sentence = []
-
-    with open(conllu_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line == "":
-                if current_sentence:
-                    sentences.append(" ".join(current_sentence))
-                    current_sentence = []
-            elif line.startswith("#"):
-                continue
-            else:
-                parts = line.split("\t")
-                if len(parts) >= 2:
-                    current_sentence.append(parts[1])
-        if current_sentence:
-            sentences.append(" ".join(current_sentence))
+    for block in SENTENCE_BREAK_RE.split(data):
+        tokens = [inner or last for inner, last in TOKEN_RE.findall(block)]
+        if tokens:
+            sentences.append(" ".join(tokens))
 
     df = pd.DataFrame(sentences, columns=["text"])
 
@@ -10,17 +10,25 @@ decode_arabic_robust.py
 
 from pathlib import Path
 import csv
+import functools
 import sys
 import math
 import re
 import pandas as pd
 import traceback
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # ------------------ EDIT PATHS HERE ------------------
 INPUT_PATH = Path("Fixes\Encoded\D5.csv")   
 OUTPUT_PATH = Path("Fixes\Decoded\D5.csv")  
 
 CHUNKSIZE = 0   
+USE_FAST_CSV = False # try the multithreaded polars CSV reader (if installed) before pandas
+USE_PARQUET = True   # also write a snappy Parquet copy next to OUTPUT_PATH (full-read path)
 # ----------------------------------------------------
 
 def safe_set_csv_field_limit():
@@ -56,14 +64,15 @@ def safe_set_csv_field_limit():
 LIMIT_SET = safe_set_csv_field_limit()
 print("csv.field_size_limit set to:", LIMIT_SET)
 
+# Matches whole runs of Arabic code points, so scoring builds one match per word, not per letter
 ARABIC_RE = re.compile(
-    r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]'
+    r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+'
 )
 
 def arabic_score(text: str) -> int:
     if not isinstance(text, str):
         return 0
-    return len(ARABIC_RE.findall(text))
+    return sum(map(len, ARABIC_RE.findall(text)))
 
 def try_decode(text: str, enc_from: str, dec_to: str):
     try:
@@ -71,17 +80,29 @@ def try_decode(text: str, enc_from: str, dec_to: str):
     except Exception:
         return None
 
+# (encode-as, decode-as) round trips tried on every non-ASCII cell
+DECODE_COMBOS = (
+    ("latin1", "utf-8"),
+    ("cp1252", "utf-8"),
+    ("utf-8", "latin1"),
+    ("cp1256", "utf-8"),
+)
+# Distinct cell values remembered by _fix_str; labels, usernames and URLs repeat a lot
+FIX_TEXT_CACHE_SIZE = 500_000
+
 def fix_text(text: str) -> str:
     if not isinstance(text, str):
         return text
+    if not text or text.isascii():
+        # every re-encoding below leaves pure ASCII unchanged
+        return text
+    return _fix_str(text)
+
+# Only str reaches the cache, so equal-hashing values like True and 1.0 can't collide
+@functools.lru_cache(maxsize=FIX_TEXT_CACHE_SIZE)
+def _fix_str(text: str) -> str:
     candidates = [text]
-    combos = [
-        ("latin1", "utf-8"),
-        ("cp1252", "utf-8"),
-        ("utf-8", "latin1"),
-        ("cp1256", "utf-8"),
-    ]
-    for enc_from, dec_to in combos:
+    for enc_from, dec_to in DECODE_COMBOS:
         t = try_decode(text, enc_from, dec_to)
         if t is not None:
             candidates.append(t)
@@ -90,7 +111,7 @@ def fix_text(text: str) -> str:
 def fix_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     obj_cols = [c for c in df.columns if df[c].dtype == 'object' or pd.api.types.is_string_dtype(df[c])]
     for col in obj_cols:
-        df[col] = df[col].map(lambda v: fix_text(v) if isinstance(v, str) else v)
+        df[col] = df[col].map(fix_text, na_action='ignore')
     return df
 
 def try_read_csv_with_strategies(path: Path):
@@ -102,6 +123,17 @@ def try_read_csv_with_strategies(path: Path):
     engines = ["c", "python"]
     last_exc = None
 
+    if USE_FAST_CSV and pl is not None:
+        try:
+            print("Trying polars.read_csv(encoding='utf8') ...")
+            # infer_schema_length=0 keeps every column as text, like dtype=str below
+            df = pl.read_csv(path, encoding="utf8", infer_schema_length=0).to_pandas()
+            print("Read successful with polars")
+            return df
+        except Exception as e:
+            print(f"  Failed with polars: {type(e).__name__}: {e}")
+            last_exc = e
+
     for enc in encodings:
         for eng in engines:
             try:
@@ -176,6 +208,13 @@ def main():
                     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
                     df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
                     print("Done. Output saved to", OUTPUT_PATH)
+                    if USE_PARQUET:
+                        parquet_path = OUTPUT_PATH.with_suffix('.parquet')
+                        try:
+                            df.to_parquet(parquet_path, compression='snappy', index=False)
+                            print("Parquet copy saved to", parquet_path)
+                        except Exception as e_pq:
+                            print("Parquet copy failed (CSV output is complete):", type(e_pq).__name__, e_pq)
                 except Exception as e_full:
                     print("Full-read attempts failed:", type(e_full).__name__, e_full)
                     fallback_chunksize = 10000
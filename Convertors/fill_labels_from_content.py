@@ -12,7 +12,6 @@ Static script for a single dataset file:
 """
 
 import os
-import re
 import pandas as pd
 
 # ---------------- USER CONFIG ----------------
@@ -22,8 +21,16 @@ EXTRACT_LABEL_COL = "label"
 ORIGINAL_TEXT_COL = "text"
 # ---------------------------------------------
 
-NOT_CYBER_RE = re.compile(r"\bnot\b[\s\-\:\,\;]*\bcyber\b", flags=re.IGNORECASE)
-CYBER_RE = re.compile(r"\bcyber\b", flags=re.IGNORECASE)
+# Plain pattern strings with inline flags: on an Arrow-backed column pandas hands these
+# to pyarrow's RE2 kernels instead of falling back to Python's re per row.
+# RE2 only treats ASCII as \s; this class body covers the rest of Python's \s (NBSP, U+3000, ...)
+UNICODE_SPACE = r"\s\v\x1c-\x1f\x85\p{Z}"
+NOT_CYBER_PATTERN = r"(?i)\bnot\b[" + UNICODE_SPACE + r"\-\:\,\;]*\bcyber\b"
+CYBER_PATTERN = r"(?i)\bcyber\b"
+# Cleanup of leftover spaces and stray punctuation once the phrases are removed
+WHITESPACE_PATTERN = r"[" + UNICODE_SPACE + r"]+"
+EDGE_PUNCT_PATTERN = (r"^[" + UNICODE_SPACE + r"\-\:\,\;\.\!]+"
+                      r"|[" + UNICODE_SPACE + r"\-\:\,\;\.\!]+$")
 
 COMMON_TEXT_NAMES = ['text', 'tweet', 'content', 'comment', 'post', 'sentence']
 
@@ -59,17 +66,6 @@ def find_text_column(df):
             return c
     return df.columns[0]
 
-def clean_after_removal(text):
-    """
-    Clean leftover spaces and stray punctuation after removing phrases.
-    """
-    if not isinstance(text, str):
-        text = "" if pd.isna(text) else str(text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'^[\s\-\:\,\;\.\!]+', '', text)
-    text = re.sub(r'[\s\-\:\,\;\.\!]+$', '', text)
-    return text
-
 def process_single_file(input_path, output_path):
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
@@ -80,40 +76,46 @@ def process_single_file(input_path, output_path):
     text_col = find_text_column(df)
     print(f"[INFO] Using text column: '{text_col}'")
 
-    df[text_col] = df[text_col].fillna('').astype(str)
+    df[text_col] = df[text_col].fillna('').astype('string[pyarrow]')
 
     if ORIGINAL_TEXT_COL not in df.columns:
         df[ORIGINAL_TEXT_COL] = df[text_col]
 
     df[EXTRACT_LABEL_COL] = ""
 
-    mask_not_cyber = df[text_col].str.contains(NOT_CYBER_RE, na=False)
-    mask_cyber = df[text_col].str.contains(CYBER_RE, na=False)
+    mask_not_cyber = df[text_col].str.contains(NOT_CYBER_PATTERN, na=False)
+    mask_cyber = df[text_col].str.contains(CYBER_PATTERN, na=False)
+    # 'not cyber' anywhere in the text wins over a bare 'cyber'
+    mask_cy_only = mask_cyber & ~mask_not_cyber
 
     if mask_not_cyber.any():
         count_nc = int(mask_not_cyber.sum())
         print(f"[INFO] Found 'not cyber' in {count_nc} rows. Extracting 'not cyber' and cleaning those rows.")
         df.loc[mask_not_cyber, EXTRACT_LABEL_COL] = "not cyber"
-        df.loc[mask_not_cyber, text_col] = df.loc[mask_not_cyber, text_col].apply(
-            lambda t: NOT_CYBER_RE.sub(" ", t)
-        )
-        df.loc[mask_not_cyber, text_col] = df.loc[mask_not_cyber, text_col].apply(
-            lambda t: CYBER_RE.sub(" ", t)
+        df.loc[mask_not_cyber, text_col] = df.loc[mask_not_cyber, text_col].str.replace(
+            NOT_CYBER_PATTERN, " ", regex=True
         )
-        df.loc[mask_not_cyber, text_col] = df.loc[mask_not_cyber, text_col].apply(clean_after_removal)
     else:
         print("[INFO] No 'not cyber' occurrences found.")
 
-    mask_cy_only = mask_cyber & (~mask_not_cyber)
     if mask_cy_only.any():
         count_cy = int(mask_cy_only.sum())
         print(f"[INFO] Found 'cyber' in {count_cy} rows (excluding 'not cyber' rows). Extracting 'cyber' and cleaning those rows.")
         df.loc[mask_cy_only, EXTRACT_LABEL_COL] = "cyber"
-        df.loc[mask_cy_only, text_col] = df.loc[mask_cy_only, text_col].apply(lambda t: CYBER_RE.sub(" ", t))
-        df.loc[mask_cy_only, text_col] = df.loc[mask_cy_only, text_col].apply(clean_after_removal)
     else:
         print("[INFO] No standalone 'cyber' occurrences found (excluding 'not cyber').")
 
+    # Remove remaining 'cyber' words and clean up every labeled row in one pass
+    mask_labeled = mask_not_cyber | mask_cy_only
+    if mask_labeled.any():
+        df.loc[mask_labeled, text_col] = (
+            df.loc[mask_labeled, text_col]
+            .str.replace(CYBER_PATTERN, " ", regex=True)
+            .str.replace(WHITESPACE_PATTERN, " ", regex=True)
+            .str.strip()
+            .str.replace(EDGE_PUNCT_PATTERN, "", regex=True)
+        )
+
     total_extracted = int((df[EXTRACT_LABEL_COL] != "").sum())
     print(f"[INFO] Total rows labeled (cyber / not cyber): {total_extracted} / {len(df)}")
 
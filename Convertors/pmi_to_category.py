@@ -1,18 +1,16 @@
+import numpy as np
 import pandas as pd
 
 # Load dataset
 df = pd.read_csv("Fixes\Decoded\D14.csv")
 
-def categorize_pmi(score):
-    if score <= 0:
-        return "Normal"
-    elif score <= 3:
-        return "Offensive"
-    else:
-        return "Profanity"
+# score <= 0 -> Normal, score <= 3 -> Offensive, otherwise Profanity
+PMI_EDGES = np.array([0, 3])
+PMI_LABELS = np.array(["Normal", "Offensive", "Profanity"])
 
-# Apply mapping
-df['pmi_score'] = df['pmi_score'].apply(categorize_pmi)
+# Apply mapping (side='left': a score equal to an edge stays in the lower bin)
+scores = df['pmi_score'].to_numpy(dtype=np.float64)
+df['pmi_score'] = PMI_LABELS[np.searchsorted(PMI_EDGES, scores, side='left')]
 
 # Save result
 df.to_csv("Fixes\Reformatted\D14.csv", index=False)